@@ -1,16 +1,31 @@
+import os
 from flask import Flask, render_template, request, redirect, url_for, session
+from jinja2 import FileSystemBytecodeCache
 
 app = Flask(__name__)
 app.secret_key = 'your_secret_key'  # Add a secret key for session
 
-photographers = [
+# Keep compiled template bytecode across restarts and compile everything up front
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+for template_name in app.jinja_env.list_templates():
+    app.jinja_env.get_template(template_name)
+
+photographers = (
     {"name": "John Doe", "skills": "Weddings, Portraits", "availability": "Available", "image": "john.jpg"},
     {"name": "Jane Smith", "skills": "Travel, Nature", "availability": "Available", "image": "jane.jpg"},
     {"name": "Sam Wilson", "skills": "Corporate, Product", "availability": "Booked", "image": "sam.jpg"},
     {"name": "Priya Patel", "skills": "Fashion, Editorial", "availability": "Available", "image": "priya.jpg"},
     {"name": "Alex Kim", "skills": "Sports, Action", "availability": "Booked", "image": "alex.jpg"},
     {"name": "Maria Garcia", "skills": "Food, Lifestyle", "availability": "Available", "image": "maria.jpg"}
-]
+)
+
+services_list = (
+    {"title": "Wedding Photography", "desc": "Capture your special day with beautiful, timeless photos.", "icon": "fa-heart"},
+    {"title": "Birthday Parties", "desc": "Fun and candid moments from your birthday celebrations.", "icon": "fa-birthday-cake"},
+    {"title": "Corporate Events", "desc": "Professional coverage for your business events and conferences.", "icon": "fa-briefcase"},
+    {"title": "Product Shoots", "desc": "High-quality images to showcase your products.", "icon": "fa-camera"},
+    {"title": "Family Portraits", "desc": "Cherish your family moments with creative portraits.", "icon": "fa-users"}
+)
 
 @app.route('/')
 def home():
@@ -38,13 +53,6 @@ def login():
 
 @app.route('/services')
 def services():
-    services_list = [
-        {"title": "Wedding Photography", "desc": "Capture your special day with beautiful, timeless photos.", "icon": "fa-heart"},
-        {"title": "Birthday Parties", "desc": "Fun and candid moments from your birthday celebrations.", "icon": "fa-birthday-cake"},
-        {"title": "Corporate Events", "desc": "Professional coverage for your business events and conferences.", "icon": "fa-briefcase"},
-        {"title": "Product Shoots", "desc": "High-quality images to showcase your products.", "icon": "fa-camera"},
-        {"title": "Family Portraits", "desc": "Cherish your family moments with creative portraits.", "icon": "fa-users"}
-    ]
     return render_template('services.html', services=services_list)
 
 @app.route('/success')
@@ -65,4 +73,6 @@ def logout():
     return redirect(url_for('home'))
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; in production run e.g.
+    #   gunicorn -k gevent -w 4 -b 0.0.0.0:5000 app:app
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
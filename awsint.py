@@ -1,17 +1,73 @@
 from flask import Flask, render_template, request, redirect, url_for
 import boto3
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from botocore.config import Config
+from jinja2 import FileSystemBytecodeCache
 
 app = Flask(__name__)
 
+# Keep compiled template bytecode across restarts and compile everything up front
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+for template_name in app.jinja_env.list_templates():
+    app.jinja_env.get_template(template_name)
+
+AWS_REGION = os.environ.get('AWS_REGION', 'ap-south-1')
+
+# Shared client config: room for the parallel scan threads, keepalive, adaptive retries
+BOTO_CONFIG = Config(
+    region_name=AWS_REGION,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+)
+
 # DynamoDB connection
-dynamodb = boto3.resource('dynamodb', region_name='ap-south-1')  # Replace with your region
+dynamodb = boto3.resource('dynamodb', config=BOTO_CONFIG)
 
 # DynamoDB tables
 photographers_table = dynamodb.Table('photographers')
 bookings_table = dynamodb.Table('booking')
 
+# Photographer listings rarely change, so keep the last scan around for a while
+PHOTOGRAPHERS_TTL = 300  # seconds
+_photographers_cache = {'items': None, 'expires': 0.0}
+
+# Parallel scan: each segment is paginated so tables over 1 MB aren't truncated
+SCAN_SEGMENTS = 4
+
+# Only fetch the attributes the templates display ('name' is a reserved word)
+PHOTOGRAPHER_PROJECTION = {
+    'ProjectionExpression': 'id, #n, skills, availability, image',
+    'ExpressionAttributeNames': {'#n': 'name'},
+}
+
+def _scan_segment(table_name, segment, **scan_kwargs):
+    # The resource's client already converts items to plain Python values
+    paginator = dynamodb.meta.client.get_paginator('scan')
+    items = []
+    for page in paginator.paginate(TableName=table_name, Segment=segment,
+                                   TotalSegments=SCAN_SEGMENTS, **scan_kwargs):
+        items.extend(page.get('Items', []))
+    return items
+
+def _parallel_scan(table_name, **scan_kwargs):
+    with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as pool:
+        segments = pool.map(lambda i: _scan_segment(table_name, i, **scan_kwargs),
+                            range(SCAN_SEGMENTS))
+        return [item for segment in segments for item in segment]
+
+def _load_photographers():
+    now = time.monotonic()
+    if _photographers_cache['items'] is None or now >= _photographers_cache['expires']:
+        _photographers_cache['items'] = _parallel_scan(photographers_table.name,
+                                                        **PHOTOGRAPHER_PROJECTION)
+        _photographers_cache['expires'] = now + PHOTOGRAPHERS_TTL
+    return _photographers_cache['items']
+
 @app.route('/')
 def home():
     return render_template('home.html', logged_in=True)
@@ -40,15 +96,13 @@ def book():
 
         return redirect(url_for('success'))
 
-    # Load photographers from DynamoDB
-    response = photographers_table.scan()
-    photographers = response.get('Items', [])
+    # Load photographers from DynamoDB (cached)
+    photographers = _load_photographers()
     return render_template('book.html', photographers=photographers)
 
 @app.route('/photographers')
 def show_photographers():
-    response = photographers_table.scan()
-    photographers = response.get('Items', [])
+    photographers = _load_photographers()
     return render_template('photographers.html', photographers=photographers)
 
 @app.route('/success')